@@ -1,7 +1,11 @@
 import sqlite3
-def init_db(): #to create the database
-    conn=sqlite3.connect("flights.db") # create database file
+def init_db(): #to create the database and return the connection the app keeps open
+    conn=sqlite3.connect("flights.db", check_same_thread=False) # create database file
     cursor=conn.cursor() # to run SQL commmands
+    cursor.execute("PRAGMA journal_mode=WAL") # readers don't block writers, saved in the db file
+    cursor.execute("PRAGMA synchronous=NORMAL") # one fsync less per commit (safe with WAL)
+    cursor.execute("PRAGMA temp_store=MEMORY") # temporary tables/indexes in RAM
+    cursor.execute("PRAGMA foreign_keys=ON") # enforce references if tables get linked later
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS reservations (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -14,4 +18,4 @@ def init_db(): #to create the database
         )
     """) # create the table by  SQL, the columns inside, and id is primary key for each row
     conn.commit() # to save the changes
-    conn.close() # to close the connection
\ No newline at end of file
+    return conn # keep the connection open, the app closes it when the window is closed
@@ -1,12 +1,109 @@
-# Import Tkinter (for GUI) and 're' (regular expressions for validation)
+# Import Tkinter (for GUI), 're' (regular expressions for validation), sqlite3,
+# and threading + queue (the database runs on its own thread)
 import tkinter as tk
+from tkinter import ttk, messagebox
 import re
+import sqlite3
+import threading
+import queue
+
+# Optional: google-re2 (pip install google-re2) checks many rows faster on big imports.
+# Without it, Python's own 're' is used.
+try:
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
 
 # Import init_db() from your database file to create/connect the DB
 from DataBase import init_db
 
-# Run init_db() → Step 2: Database Setup (creates 'flights.db' and table if missing)
-init_db()
+# Validation patterns, compiled once when the program starts.
+# They spell out ASCII classes instead of \s and \d: those mean different
+# things in 're' (Unicode) and 're2' (ASCII), and all three patterns must
+# accept exactly the same values.
+NAME_RE = re.compile(r"[A-Za-z \t\n\r\f]+")                # letters and spaces only
+DATE_RE = re.compile(r"[0-9]{2}/[0-9]{2}/[0-9]{4}")        # MM/DD/YYYY
+# Name and date of one row joined with "|" (which neither field may contain),
+# so a whole row is checked with a single match when validating many rows.
+# Empty fields are allowed, like on the forms.
+ROW_RE = regex_engine.compile(
+    r"(?P<name>[A-Za-z \t\n\r\f]*)\|(?P<date>(?:[0-9]{2}/[0-9]{2}/[0-9]{4})?)")
+
+
+def validate_name_value(value):
+    """Return True if the name contains only letters and spaces."""
+    return NAME_RE.fullmatch(value) is not None
+
+
+def validate_date_value(value):
+    """Return True if the date follows the MM/DD/YYYY format."""
+    return DATE_RE.fullmatch(value) is not None
+
+
+def find_invalid_rows(rows):
+    """
+    Check the name and date of many rows, e.g. before a bulk insert.
+    Each row is (name, flight_number, departure, destination, date, seat_number);
+    a None name or date counts as empty.
+    Returns a list of (row_index, error_message) for the rows that are not valid.
+    """
+    invalid = []
+    for index, row in enumerate(rows):
+        # None means an empty field (the columns allow NULL)
+        name = "" if row[0] is None else row[0]
+        date = "" if row[4] is None else row[4]
+        if not (isinstance(name, str) and isinstance(date, str)):
+            if not isinstance(name, str):
+                invalid.append((index, "Name must be text"))
+            if not isinstance(date, str):
+                invalid.append((index, "Date must be text"))
+            continue
+        if ROW_RE.fullmatch(name + "|" + date):
+            continue
+        # The row failed → check each field on its own to tell which one is wrong
+        if name and not validate_name_value(name):
+            invalid.append((index, "Name must contain letters and spaces only"))
+        if date and not validate_date_value(date):
+            invalid.append((index, "Date must be in MM/DD/YYYY format"))
+    return invalid
+
+
+def parse_reservation_id(value):
+    """
+    Return the ID typed by the user as an int, or None if it is not made of
+    the digits 0-9 only (int() alone would also accept "1_000", "-4" or non-ASCII digits).
+    """
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        return int(value)
+    return None
+
+
+# SQL statements used by the pages. Reusing the exact same strings lets
+# sqlite3 reuse its already prepared statements instead of re-parsing them.
+SQL_INSERT = """INSERT INTO reservations
+                (name, flight_number, departure, destination, date, seat_number)
+                VALUES (?, ?, ?, ?, ?, ?)"""
+# One page of the reservation list: the rows after the last ID already shown
+SQL_SELECT_PAGE = "SELECT * FROM reservations WHERE id > ? ORDER BY id LIMIT ?"
+SQL_SELECT_BY_ID = """SELECT name, flight_number, departure, destination, date, seat_number
+                      FROM reservations WHERE id=?"""
+SQL_DELETE_BY_ID = "DELETE FROM reservations WHERE id=?"
+# COALESCE(NULLIF(?, ''), column) keeps the original database value
+# when the user left that field empty. RETURNING gives back the updated row
+# (no row → the ID does not exist), so no second query is needed.
+SQL_UPDATE_BY_ID = """UPDATE reservations SET
+                          name = COALESCE(NULLIF(?, ''), name),
+                          flight_number = COALESCE(NULLIF(?, ''), flight_number),
+                          departure = COALESCE(NULLIF(?, ''), departure),
+                          destination = COALESCE(NULLIF(?, ''), destination),
+                          date = COALESCE(NULLIF(?, ''), date),
+                          seat_number = COALESCE(NULLIF(?, ''), seat_number)
+                      WHERE id = ?
+                      RETURNING id, name, flight_number, departure, destination, date, seat_number"""
+
+# How many reservations are read at a time for the list page
+PAGE_SIZE = 100
 
 
 # ----------------------------- APPLICATION (Main Window) -----------------------------
@@ -23,16 +120,40 @@ class ReservationApp(tk.Tk):
         self.geometry("700x520")
         self.resizable(False, False)
 
+        # Step 2: Database Setup (creates 'flights.db' and table if missing).
+        # One connection is opened here and used only by the database thread,
+        # so a slow disk never freezes the window.
+        self.conn = init_db()
+        self.conn.row_factory = sqlite3.Row   # rows can be read by column name: row["date"]
+
+        # Pages put (job, callback, on_error) in db_jobs; the database thread runs
+        # job(conn) and puts (callback, result) - or (on_error, error) if it
+        # failed - in db_results, which the Tk thread picks up in poll_db_results().
+        self.db_jobs = queue.Queue()
+        self.db_results = queue.Queue()
+        self.db_thread = threading.Thread(target=self.db_worker, daemon=True)
+        self.db_thread.start()
+        self.poll_db_results()
+
+        # Close the database connection when the window is closed
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # First page of reservations (None = not read yet, or outdated). It is
+        # read in the background at startup so "View Reservations" does not
+        # have to wait; later pages are read when the user scrolls, and stay
+        # in the list's table, so they are never read twice.
+        self.first_page = None
+        # Pages being read right now: after_id -> [(callback, on_error), ...]
+        self.pending_pages = {}
+        self.load_page(0, lambda rows: None)
+
         # 'container' is a big frame that will hold all pages (Home, Booking, List, Edit)
-        container = tk.Frame(self)
-        container.pack(fill="both", expand=True)
+        self.container = tk.Frame(self)
+        self.container.pack(fill="both", expand=True)
 
-        # Create one instance of each page class and store in self.frames
+        # Pages are created the first time they are shown (see get_frame),
+        # so the window appears after building only the Home page
         self.frames = {}
-        for PageClass in (HomePage, BookingPage, ReservationListPage, EditReservationPage):
-            page = PageClass(container, self)   # parent = container, controller = main app
-            self.frames[PageClass] = page
-            page.grid(row=0, column=0, sticky="nsew")
 
         # Show the home page first
         self.show_frame(HomePage)
@@ -42,17 +163,145 @@ class ReservationApp(tk.Tk):
         Displays the selected page.
         Also clears success/error messages if the page is EditReservationPage (so it opens clean).
         """
-        frame = self.frames[page_class]
+        frame = self.get_frame(page_class)
 
         # ----- reset messages when opening Edit page -----
         if page_class == EditReservationPage:
-            frame.status_label.config(text="")
-            frame.name_error.config(text="")
-            frame.date_error.config(text="")
+            frame.reset_messages()
 
         # Bring this frame to the top
         frame.tkraise()
 
+    def get_frame(self, page_class):
+        """
+        Returns the page of the given class, creating it the first time it is needed.
+        """
+        if page_class not in self.frames:
+            page = page_class(self.container, self)   # parent = container, controller = main app
+            page.grid(row=0, column=0, sticky="nsew")
+            self.frames[page_class] = page
+        return self.frames[page_class]
+
+    # -- Database thread --
+    def run_db(self, job, callback=None, on_error=None):
+        """
+        Queue job(conn) to run on the database thread.
+        When it is done, callback(result) is called on the Tk thread.
+        If it raises, on_error(error) is called instead (default: show_db_error).
+        """
+        self.db_jobs.put((job, callback, on_error))
+
+    def db_worker(self):
+        """
+        Runs on the database thread: executes the queued jobs one by one.
+        A None job means the app is closing → close the connection and stop.
+        """
+        while True:
+            job, callback, on_error = self.db_jobs.get()
+            if job is None:
+                self.conn.close()
+                return
+            try:
+                result = job(self.conn)
+            except Exception as error:   # keep the thread alive, report on the Tk thread
+                self.db_results.put((on_error or self.show_db_error, error))
+                continue
+            if callback:
+                self.db_results.put((callback, result))
+
+    def poll_db_results(self):
+        """
+        Runs on the Tk thread every 20 ms and hands finished database results to their callbacks.
+        """
+        try:
+            while True:
+                try:
+                    callback, result = self.db_results.get_nowait()
+                except queue.Empty:
+                    break
+                callback(result)
+        finally:
+            # Always poll again, even if a callback raised an error
+            self.after(20, self.poll_db_results)
+
+    def show_db_error(self, error):
+        """
+        Default error handler for database jobs that don't pass their own.
+        """
+        messagebox.showerror("Database error", str(error))
+
+    # -- Reservation list --
+    def load_page(self, after_id, callback, on_error=None):
+        """
+        Gets the page of reservations that comes after after_id and calls callback(rows).
+        The prefetched first page is returned without reading the database, and
+        a page that is already being read is not read a second time.
+        """
+        if after_id == 0 and self.first_page is not None:
+            callback(self.first_page)
+            return
+
+        # The same page is already being read → wait for that result
+        if after_id in self.pending_pages:
+            self.pending_pages[after_id].append((callback, on_error))
+            return
+        self.pending_pages[after_id] = [(callback, on_error)]
+
+        def done(rows):
+            rows = [tuple(row) for row in rows]
+            if after_id == 0:
+                self.first_page = rows
+            for waiting_callback, _ in self.pending_pages.pop(after_id):
+                waiting_callback(rows)
+
+        def failed(error):
+            for _, waiting_on_error in self.pending_pages.pop(after_id):
+                (waiting_on_error or self.show_db_error)(error)
+
+        self.run_db(lambda conn: conn.execute(SQL_SELECT_PAGE, (after_id, PAGE_SIZE)).fetchall(),
+                    done, failed)
+
+    def reservation_added(self, row):
+        """
+        Called after a reservation was saved: shows it on the list page.
+        """
+        self.first_page = None   # may be outdated now
+        if ReservationListPage in self.frames:
+            self.frames[ReservationListPage].add_row(row)
+
+    def reservation_changed(self, row):
+        """
+        Called after a reservation was updated, with its new values.
+        """
+        self.first_page = None
+        if ReservationListPage in self.frames:
+            self.frames[ReservationListPage].update_row(row)
+
+    def reservation_deleted(self, reservation_id):
+        """
+        Called after a reservation was deleted.
+        """
+        self.first_page = None
+        if ReservationListPage in self.frames:
+            self.frames[ReservationListPage].remove_row(reservation_id)
+
+    def reservations_reloaded(self):
+        """
+        Called after many reservations changed at once (bulk import): start the list again.
+        """
+        self.first_page = None
+        if ReservationListPage in self.frames:
+            self.frames[ReservationListPage].reset()
+
+    def on_close(self):
+        """
+        Lets the database thread finish its queued work and close the connection,
+        then closes the window.
+        """
+        self.db_jobs.put((None, None, None))
+        self.db_thread.join()
+        self.destroy()
+
 
 # ----------------------------- HOME PAGE -----------------------------
 class HomePage(tk.Frame):
@@ -78,7 +327,7 @@ class HomePage(tk.Frame):
         tk.Button(
             self, text="View Reservations",
             command=lambda: [controller.show_frame(ReservationListPage),
-                             controller.frames[ReservationListPage].load_reservations()],
+                             controller.get_frame(ReservationListPage).load_reservations()],
             width=20
         ).pack(pady=10)
 
@@ -92,6 +341,7 @@ class BookingPage(tk.Frame):
 
     def __init__(self, parent, controller):
         super().__init__(parent)
+        self.controller = controller
 
         tk.Label(self, text="Booking Page", font=("Arial", 20, "bold")).pack(pady=20)
 
@@ -139,6 +389,11 @@ class BookingPage(tk.Frame):
         self.name_entry.bind("<FocusOut>", self.validate_name)
         self.date_entry.bind("<FocusOut>", self.validate_date)
 
+        # Result of the last validation + the text it was run on,
+        # so saving does not re-check fields that did not change
+        self._name_ok = self._date_ok = True
+        self._last_name = self._last_date = ""
+
     # -- Validation methods --
     def validate_name(self, e=None):
         """
@@ -146,7 +401,9 @@ class BookingPage(tk.Frame):
         If invalid => show red error. If valid => clear error.
         """
         value = self.name_entry.get()
-        if value and not re.fullmatch(r"[A-Za-z\s]+", value):
+        self._last_name = value
+        self._name_ok = not value or validate_name_value(value)
+        if not self._name_ok:
             self.name_error.config(text="❌ Name must contain letters and spaces only")
         else:
             self.name_error.config(text="")
@@ -157,7 +414,9 @@ class BookingPage(tk.Frame):
         Shows a red error message when the format is wrong.
         """
         value = self.date_entry.get()
-        if value and not re.fullmatch(r"\d{2}/\d{2}/\d{4}", value):
+        self._last_date = value
+        self._date_ok = not value or validate_date_value(value)
+        if not self._date_ok:
             self.date_error.config(text="❌ Date must be in MM/DD/YYYY format (ex: 08/25/2025)")
         else:
             self.date_error.config(text="")
@@ -167,52 +426,121 @@ class BookingPage(tk.Frame):
         """
         Insert a new reservation into the database after validation.
         """
-        import sqlite3
-
-        # Re-check validation
-        self.validate_name()
-        self.validate_date()
-        if self.name_error.cget("text") or self.date_error.cget("text"):
-            return  # Stop if invalid
-
-        # Collect values from fields
+        # Collect values from fields (each .get() is a call into Tk, so read them once)
         values = (
             self.name_entry.get(), self.flight_entry.get(),
             self.departure_entry.get(), self.destination_entry.get(),
             self.date_entry.get(), self.seat_entry.get()
         )
 
-        # Insert into database table
-        conn = sqlite3.connect("flights.db")
-        cursor = conn.cursor()
-        cursor.execute("""INSERT INTO reservations
-                          (name, flight_number, departure, destination, date, seat_number)
-                          VALUES (?, ?, ?, ?, ?, ?)""", values)
-        conn.commit()
-        conn.close()
+        # Re-check validation (only fields changed since they were last validated)
+        if values[0] != self._last_name:
+            self.validate_name()
+        if values[4] != self._last_date:
+            self.validate_date()
+        if not (self._name_ok and self._date_ok):
+            return  # Stop if invalid
+
+        # Insert into database table (on the database thread)
+        # ('with conn' runs it in one transaction: commit on success, rollback on error)
+        def insert(conn):
+            with conn:
+                return conn.execute(SQL_INSERT, values).lastrowid
+
+        self.controller.run_db(insert, lambda new_id: self.on_saved(new_id, values),
+                               self.on_save_failed)
+
+    def on_saved(self, new_id, values):
+        """
+        Called when the new reservation is stored in the database.
+        """
+        self.controller.reservation_added((new_id,) + values)
 
         # Show success message + clear boxes
-        self.status_label.config(text="✅ Reservation saved!")
+        self.status_label.config(text="✅ Reservation saved!", fg="green")
         for entry in (self.name_entry, self.flight_entry, self.departure_entry,
                       self.destination_entry, self.date_entry, self.seat_entry):
             entry.delete(0, tk.END)
 
+    def on_save_failed(self, error):
+        """
+        Called when the reservation could not be stored (the fields are kept).
+        """
+        self.status_label.config(text="❌ Could not save: %s" % error, fg="red")
+
+    # -- Save many reservations at once (bulk CREATE, e.g. for imports / test data) --
+    def save_many(self, rows, on_done=None, on_error=None):
+        """
+        Insert many reservations in a single transaction.
+        Each row is a tuple: (name, flight_number, departure, destination, date, seat_number).
+        Rows are sent in chunks as one multi-row INSERT per chunk, so SQLite's
+        limit of 999 '?' placeholders per statement is never exceeded.
+        Raises ValueError (and saves nothing) if a name or date is not valid.
+        on_done() is called when the rows are saved, on_error(error) if the
+        database rejected them (nothing is saved then either).
+        """
+        rows = list(rows)
+        invalid = find_invalid_rows(rows)
+        if invalid:
+            raise ValueError("Invalid rows: " + "; ".join(
+                "row %d: %s" % (index, message) for index, message in invalid))
+        chunk_size = 999 // 6   # 6 placeholders per row
+
+        def insert_many(conn):
+            with conn:
+                for start in range(0, len(rows), chunk_size):
+                    chunk = rows[start:start + chunk_size]
+                    placeholders = ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk))
+                    values = [value for row in chunk for value in row]
+                    conn.execute("INSERT INTO reservations "
+                                 "(name, flight_number, departure, destination, date, seat_number) "
+                                 "VALUES " + placeholders, values)
+
+        def done(result):
+            # Many new rows → simply reload the list from the first page
+            self.controller.reservations_reloaded()
+            if on_done:
+                on_done()
+
+        self.controller.run_db(insert_many, done, on_error)
+
 
 # --------------------------  RESERVATION LIST PAGE (Read + Delete) --------------------------
 class ReservationListPage(tk.Frame):
     """
-    Displays all saved reservations in a listbox.
+    Displays the saved reservations in a table (ttk.Treeview).
+    Reservations are read one page at a time: the next page is loaded
+    when the user scrolls near the bottom of the table. Saving, editing or
+    deleting a reservation only changes its own row in the table.
     Also provides a field to delete a reservation by ID.
     Step 3.2 – Read + Delete.
     """
     def __init__(self, parent, controller):
         super().__init__(parent)
+        self.controller = controller
         tk.Label(self, text="Reservation List Page",
                  font=("Arial", 20, "bold")).pack(pady=20)
 
-        # Listbox widget used to show all records
-        self.listbox = tk.Listbox(self, width=95)
-        self.listbox.pack(pady=10)
+        # Table used to show the records + vertical scrollbar
+        table_frame = tk.Frame(self)
+        table_frame.pack(pady=10)
+        columns = [("id", "ID", 40), ("name", "Name", 140), ("flight_number", "Flight", 80),
+                   ("departure", "From", 100), ("destination", "To", 100),
+                   ("date", "Date", 90), ("seat_number", "Seat", 60)]
+        self.tree = ttk.Treeview(table_frame, columns=[c[0] for c in columns],
+                                 show="headings", height=10)
+        for column, heading, width in columns:
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width)
+        self.scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
+        self.tree.pack(side="left")
+        self.scrollbar.pack(side="right", fill="y")
+        self.more_pending = False   # True while the next page is being read
+        self.last_id = 0            # ID of the last row in the table
+        self.at_end = False         # True once the last page is in the table
+        self.loaded = False         # True once the first page is in the table
+        self.generation = 0         # changes on reset(), so old pages are ignored
 
         # Navigation buttons
         tk.Button(self, text="Back to Home",
@@ -227,36 +555,129 @@ class ReservationListPage(tk.Frame):
         tk.Button(self, text="Delete Reservation",
                   command=self.delete_reservation, width=20).pack(pady=5)
 
-        self.load_reservations()
+        # Error message (e.g. when the ID is not a number)
+        self.status_label = tk.Label(self, text="", fg="red")
+        self.status_label.pack()
+        # (the list is filled when the page is opened from the Home page)
 
     def load_reservations(self):
         """
-        Read all rows from the reservations table and display them in the listbox.
+        Fill the table with the first page of reservations, the first time the page is shown.
+        After that the table is kept up to date row by row, so nothing is reloaded.
+        """
+        if not self.loaded:
+            self.request_page()
+
+    def request_page(self):
+        """
+        Ask the controller for the page after the last row in the table.
+        """
+        if self.more_pending or self.at_end:
+            return
+        self.more_pending = True
+        generation = self.generation
+        self.controller.load_page(self.last_id,
+                                  lambda rows: self.on_page_loaded(generation, rows),
+                                  self.on_db_error)
+
+    def on_page_loaded(self, generation, rows):
         """
-        import sqlite3
-        conn = sqlite3.connect("flights.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM reservations")
-        rows = cursor.fetchall()
-        self.listbox.delete(0, tk.END)
+        Called with a page of reservations: add it at the end of the table.
+        """
+        if generation != self.generation:
+            return   # the table was reset meanwhile → this page is outdated
+        self.more_pending = False
         for row in rows:
-            display_text = f"ID:{row[0]} | Name:{row[1]} | Flight:{row[2]} | From:{row[3]} | To:{row[4]} | Date:{row[5]} | Seat:{row[6]}"
-            self.listbox.insert(tk.END, display_text)
-        conn.close()
+            self.tree.insert("", tk.END, iid=str(row[0]), values=row)
+        if rows:
+            self.last_id = rows[-1][0]
+        self.at_end = len(rows) < PAGE_SIZE
+        self.loaded = True
+
+    def on_tree_scroll(self, first, last):
+        """
+        Called by the table whenever the visible part changes.
+        Moves the scrollbar, and loads the next page when the bottom is almost reached.
+        """
+        self.scrollbar.set(first, last)
+        if self.loaded and float(last) >= 0.9:
+            self.after_idle(self.request_page)   # don't change the table while it is redrawing
+
+    def add_row(self, row):
+        """
+        Show a newly saved reservation. If the last page is not in the table
+        yet, the row is shown with it when the user scrolls down.
+        """
+        if self.loaded and self.at_end:
+            self.tree.insert("", tk.END, iid=str(row[0]), values=row)
+            self.last_id = row[0]
+
+    def update_row(self, row):
+        """
+        Show the new values of an edited reservation (if its row is in the table).
+        """
+        if self.tree.exists(str(row[0])):
+            self.tree.item(str(row[0]), values=row)
+
+    def remove_row(self, reservation_id):
+        """
+        Remove a deleted reservation from the table (if its row is in the table).
+        """
+        if self.tree.exists(str(reservation_id)):
+            self.tree.delete(str(reservation_id))
+
+    def reset(self):
+        """
+        Empty the table and load it again from the first page.
+        """
+        self.generation += 1
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)   # one Tk call to clear the table
+        self.more_pending = False
+        self.last_id = 0
+        self.at_end = False
+        self.loaded = False
+        self.load_reservations()
+
+    def on_db_error(self, error):
+        """
+        Called when reading or deleting reservations failed.
+        """
+        self.more_pending = False   # allow loading the next page again
+        self.status_label.config(text="❌ Database error: %s" % error)
 
     def delete_reservation(self):
         """
         Delete a record by its ID and refresh the list afterwards.
         Also clears the delete ID entry box so it's ready for the next input.
         """
-        import sqlite3
-        reservation_id = self.delete_id_entry.get()
-        conn = sqlite3.connect("flights.db")
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM reservations WHERE id=?", (reservation_id,))
-        conn.commit()
-        conn.close()
-        self.load_reservations()
+        value = self.delete_id_entry.get()
+        if not value.strip():
+            self.status_label.config(text="❌ ID required")
+            return
+        reservation_id = parse_reservation_id(value)
+        if reservation_id is None:
+            self.status_label.config(text="❌ ID must be numeric")
+            return
+        self.status_label.config(text="")
+
+        def delete(conn):
+            with conn:
+                return conn.execute(SQL_DELETE_BY_ID, (reservation_id,)).rowcount
+
+        self.controller.run_db(delete, lambda count: self.on_deleted(reservation_id, count),
+                               self.on_db_error)
+
+    def on_deleted(self, reservation_id, count):
+        """
+        Called when the delete is done: remove the row from the table.
+        """
+        # Nothing deleted → the ID does not exist (keep it in the box so it can be fixed)
+        if count == 0:
+            self.status_label.config(text="❌ ID not found")
+            return
+        self.controller.reservation_deleted(reservation_id)
         self.delete_id_entry.delete(0, tk.END)   # Clear after deleting
 
 
@@ -288,9 +709,13 @@ class EditReservationPage(tk.Frame):
         self.destination_entry = tk.Entry(self, width=40)
         self.seat_entry = tk.Entry(self, width=40)
 
-        self.name_error = tk.Label(self, text="", fg="red")
-        self.date_error = tk.Label(self, text="", fg="red")
-        self.status_label = tk.Label(self, text="", fg="green")
+        # Messages are kept in StringVars: setting a variable updates its label
+        self.name_err_var = tk.StringVar()
+        self.date_err_var = tk.StringVar()
+        self.status_var = tk.StringVar()
+        self.name_error = tk.Label(self, textvariable=self.name_err_var, fg="red")
+        self.date_error = tk.Label(self, textvariable=self.date_err_var, fg="red")
+        self.status_label = tk.Label(self, textvariable=self.status_var, fg="green")
 
         # Labels and field packing
         for label_text, entry in [
@@ -324,105 +749,145 @@ class EditReservationPage(tk.Frame):
         self.name_entry.bind("<FocusOut>", self.validate_name)
         self.date_entry.bind("<FocusOut>", self.validate_date)
 
+        # Result of the last validation + the text it was run on,
+        # so saving does not re-check fields that did not change
+        self._name_ok = self._date_ok = True
+        self._last_name = self._last_date = ""
+
+    def reset_messages(self):
+        """
+        Clears the success/error messages (so the page opens clean).
+        """
+        self.status_var.set("")
+        self.name_err_var.set("")
+        self.date_err_var.set("")
+
+    def show_status(self, text, color):
+        """
+        Shows a success (green) or error (red) message under the buttons.
+        """
+        self.status_label.config(fg=color)
+        self.status_var.set(text)
+
+    def on_db_error(self, error):
+        """
+        Called when reading or updating the reservation failed.
+        """
+        self.show_status("❌ Database error: %s" % error, "red")
+
     # Validation same logic as BookingPage
     def validate_name(self, e=None):
         value = self.name_entry.get()
-        if value and not re.fullmatch(r"[A-Za-z\s]+", value):
-            self.name_error.config(text="❌ Name must contain letters and spaces only")
+        self._last_name = value
+        self._name_ok = not value or validate_name_value(value)
+        if not self._name_ok:
+            self.name_err_var.set("❌ Name must contain letters and spaces only")
         else:
-            self.name_error.config(text="")
+            self.name_err_var.set("")
 
     def validate_date(self, e=None):
         value = self.date_entry.get()
-        if value and not re.fullmatch(r"\d{2}/\d{2}/\d{4}", value):
-            self.date_error.config(text="❌ Date must be in MM/DD/YYYY format (ex: 08/25/2025)")
+        self._last_date = value
+        self._date_ok = not value or validate_date_value(value)
+        if not self._date_ok:
+            self.date_err_var.set("❌ Date must be in MM/DD/YYYY format (ex: 08/25/2025)")
         else:
-            self.date_error.config(text="")
+            self.date_err_var.set("")
 
     def load_reservation(self, e=None):
         """
         Automatically loads the values of the reservation with given ID.
         This runs when the user finishes typing the ID and clicks outside the box.
         """
-        import sqlite3
         # Clear any old messages
-        self.status_label.config(text="")
+        self.status_var.set("")
 
-        reservation_id = self.id_entry.get().strip()
-        if not reservation_id:
+        value = self.id_entry.get()
+        if not value.strip():
             return  # empty → do nothing
 
-        conn = sqlite3.connect("flights.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM reservations WHERE id=?", (reservation_id,))
-        row = cursor.fetchone()
-        conn.close()
+        reservation_id = parse_reservation_id(value)
+        if reservation_id is None:
+            self.show_status("❌ ID must be numeric", "red")
+            return
+
+        self.controller.run_db(
+            lambda conn: conn.execute(SQL_SELECT_BY_ID, (reservation_id,)).fetchone(),
+            self.fill_form, self.on_db_error)
 
+    def fill_form(self, row):
+        """
+        Called with the reservation read from the database (None if the ID does not exist).
+        """
         if row:
             # Fill all fields with current values
-            self.name_entry.delete(0, tk.END);        self.name_entry.insert(0, row[1])
-            self.date_entry.delete(0, tk.END);        self.date_entry.insert(0, row[5])
-            self.flight_entry.delete(0, tk.END);      self.flight_entry.insert(0, row[2])
-            self.departure_entry.delete(0, tk.END);   self.departure_entry.insert(0, row[3])
-            self.destination_entry.delete(0, tk.END); self.destination_entry.insert(0, row[4])
-            self.seat_entry.delete(0, tk.END);        self.seat_entry.insert(0, row[6])
+            self.name_entry.delete(0, tk.END);        self.name_entry.insert(0, row["name"])
+            self.date_entry.delete(0, tk.END);        self.date_entry.insert(0, row["date"])
+            self.flight_entry.delete(0, tk.END);      self.flight_entry.insert(0, row["flight_number"])
+            self.departure_entry.delete(0, tk.END);   self.departure_entry.insert(0, row["departure"])
+            self.destination_entry.delete(0, tk.END); self.destination_entry.insert(0, row["destination"])
+            self.seat_entry.delete(0, tk.END);        self.seat_entry.insert(0, row["seat_number"])
 
     def update_reservation(self):
         """
         Updates the reservation.  Only fields that the user changed will be updated,
         and others stay the same.
         """
-        import sqlite3
-
         # Clear confirmation
-        self.status_label.config(text="")
+        self.status_var.set("")
+
+        # Read every field once (each .get() is a call into Tk)
+        name = self.name_entry.get()
+        date = self.date_entry.get()
+        flight = self.flight_entry.get()
+        dep = self.departure_entry.get()
+        dest = self.destination_entry.get()
+        seat = self.seat_entry.get()
+
+        # Validate Name / Date (only fields changed since they were last validated)
+        if name != self._last_name:
+            self.validate_name()
+        if date != self._last_date:
+            self.validate_date()
+        # Stop if a field is invalid
+        if not (self._name_ok and self._date_ok):
+            # reset_messages() may have cleared the messages, so show them again
+            # from the cached results (no need to run the regex again)
+            if not self._name_ok:
+                self.name_err_var.set("❌ Name must contain letters and spaces only")
+            if not self._date_ok:
+                self.date_err_var.set("❌ Date must be in MM/DD/YYYY format (ex: 08/25/2025)")
+            return
 
-        # Validate Name / Date
-        self.validate_name()
-        self.validate_date()
-        # Stop if validation error is displayed
-        if self.name_error.cget("text") or self.date_error.cget("text"):
+        value = self.id_entry.get()
+        if not value.strip():
+            self.show_status("❌ ID required", "red")
+            return
+        reservation_id = parse_reservation_id(value)
+        if reservation_id is None:
+            self.show_status("❌ ID must be numeric", "red")
             return
+        # UPDATE query (inside a transaction, committed when the 'with' block ends);
+        # it returns the updated row, or None if the ID does not exist
+        def update(conn):
+            with conn:
+                row = conn.execute(SQL_UPDATE_BY_ID,
+                                   (name, flight, dep, dest, date, seat, reservation_id)).fetchone()
+            return tuple(row) if row else None
 
-        # Check if ID exists
-        reservation_id = self.id_entry.get()
-        conn = sqlite3.connect("flights.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM reservations WHERE id=?", (reservation_id,))
-        row = cursor.fetchone()
+        self.controller.run_db(update, self.on_updated, self.on_db_error)
 
-        if not row:
-            self.status_label.config(text="❌ ID not found", fg="red")
+    def on_updated(self, row):
+        """
+        Called when the UPDATE is done, with the updated row (None if the ID does not exist).
+        """
+        if row is None:
+            self.show_status("❌ ID not found", "red")
             return
 
-        # Choose new value if user changed it, otherwise keep the original database value
-        updated_values = {
-            'name':   self.name_entry.get()   if self.name_entry.get()   else row[1],
-            'date':   self.date_entry.get()   if self.date_entry.get()   else row[5],
-            'flight': self.flight_entry.get() if self.flight_entry.get() else row[2],
-            'dep':    self.departure_entry.get() if self.departure_entry.get() else row[3],
-            'dest':   self.destination_entry.get() if self.destination_entry.get() else row[4],
-            'seat':   self.seat_entry.get() if self.seat_entry.get() else row[6],
-        }
-
-        # UPDATE query
-        cursor.execute("""
-            UPDATE reservations SET
-                name = ?,
-                flight_number = ?,
-                departure = ?,
-                destination = ?,
-                date = ?,
-                seat_number = ?
-            WHERE id = ?
-        """, (updated_values['name'], updated_values['flight'], updated_values['dep'],
-              updated_values['dest'], updated_values['date'], updated_values['seat'], reservation_id))
-        conn.commit()
-        conn.close()
-
-        # Confirmation + refresh list
-        self.status_label.config(text="✅ Changes saved!", fg="green")
-        self.controller.frames[ReservationListPage].load_reservations()
+        # Confirmation + update the row in the list
+        self.controller.reservation_changed(row)
+        self.show_status("✅ Changes saved!", "green")
 
         # Clear fields
         for entry in (self.id_entry, self.name_entry, self.date_entry, self.flight_entry,